@@ -1,26 +1,80 @@
 """Main export logic for Obsidian MOC Exporter."""
 
+import os
 import re
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+
+# Optional faster engine: the third-party 'regex' package is API-compatible
+# with stdlib re and scans bulk markdown noticeably faster. It is not a
+# required dependency; stdlib re is the fallback. The patterns below use no
+# backreferences, so semantics are identical on both engines.
+try:
+    import regex as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Regex patterns for Obsidian syntax, compiled once at import. Keep all
+# patterns at module scope: compiling per instance or per call is an easy
+# regression to introduce if these ever become configurable, and it costs
+# orders of magnitude more than the match itself on bulk conversion.
+#
+# _LINK_RE covers embeds and wiki-links in one alternation so conversion
+# needs a single pass over the content: group 1 = optional '!',
+# group 2 = filename (heading already split off, may be empty for
+# same-page links like [[#Heading]]), group 3 = heading/block reference,
+# group 4 = alias.
+_LINK_RE = _re_engine.compile(r'(!?)\[\[([^\]|#]*)(#[^\]|]*)?(?:\|([^\]]+))?\]\]')
+
+# Width/dimension specification in an embed alias, e.g. "300" or "300x200"
+_DIMENSION_RE = _re_engine.compile(r'^\d+(x\d+)?$')
+
+# Supported attachment extensions
+_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp'})
+_DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'})
+_MEDIA_EXTENSIONS = frozenset({'.mp3', '.wav', '.mp4', '.webm', '.ogg'})
+_ATTACHMENT_EXTENSIONS = _IMAGE_EXTENSIONS | _DOCUMENT_EXTENSIONS | _MEDIA_EXTENSIONS
+
+# Single anchored alternation so the attachment check is one C-level scan;
+# built from the extension sets so the two can never drift apart
+_ATTACHMENT_RE = _re_engine.compile(
+    r'\.(?:' + '|'.join(ext[1:] for ext in sorted(_ATTACHMENT_EXTENSIONS)) + r')$',
+    re.IGNORECASE,
+)
+
+
+def _ext(name: str) -> str:
+    """Return the lowercased extension of a filename, or '' if it has none.
+
+    Cheaper than Path(name).suffix on hot paths since it avoids
+    instantiating a PurePath per call.
+    """
+    i = name.rfind('.')
+    return name[i:].lower() if i >= 0 else ''
 
 
 class ObsidianMOCExporter:
     """Export Obsidian notes starting from a MOC file to standard Markdown."""
 
-    # Regex patterns for Obsidian syntax
-    WIKILINK_PATTERN = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
-    EMBED_PATTERN = re.compile(r'!\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
-    COMMENT_PATTERN = re.compile(r'%%.*?%%', re.DOTALL)
+    # Alias for the module-level pattern (see note above its definition)
+    LINK_PATTERN = _LINK_RE
 
-    # Supported attachment extensions
-    IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp'}
-    DOCUMENT_EXTENSIONS = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'}
-    MEDIA_EXTENSIONS = {'.mp3', '.wav', '.mp4', '.webm', '.ogg'}
-    ATTACHMENT_EXTENSIONS = IMAGE_EXTENSIONS | DOCUMENT_EXTENSIONS | MEDIA_EXTENSIONS
+    # Supported attachment extensions (aliases for the module-level sets)
+    IMAGE_EXTENSIONS = _IMAGE_EXTENSIONS
+    DOCUMENT_EXTENSIONS = _DOCUMENT_EXTENSIONS
+    MEDIA_EXTENSIONS = _MEDIA_EXTENSIONS
+    ATTACHMENT_EXTENSIONS = _ATTACHMENT_EXTENSIONS
 
-    def __init__(self, vault_path: Path, output_path: Path, max_depth: int = 2):
+    # Directories never scanned for notes or attachments; dot-directories
+    # (.git, .obsidian, .trash, ...) are always skipped
+    DEFAULT_SKIP_DIRS = frozenset({'node_modules', '__pycache__'})
+
+    def __init__(self, vault_path: Path, output_path: Path, max_depth: int = 2,
+                 skip_dirs: set[str] | None = None):
         """
         Initialize the exporter.
 
@@ -28,21 +82,80 @@ class ObsidianMOCExporter:
             vault_path: Path to the Obsidian vault root
             output_path: Path to the output directory
             max_depth: Maximum link traversal depth (default: 2)
+            skip_dirs: Directory names to skip while scanning the vault
+                (default: DEFAULT_SKIP_DIRS)
         """
         self.vault_path = vault_path
         self.output_path = output_path
         self.max_depth = max_depth
-        self.collected_notes: dict[Path, int] = {}  # note_path -> depth
-        self.collected_attachments: set[Path] = set()
+        self.skip_dirs = skip_dirs if skip_dirs is not None else self.DEFAULT_SKIP_DIRS
+        # Keyed by str(path): strings cache their hash, so the dedup checks
+        # in traversal avoid re-hashing Path objects on every probe
+        self.collected_notes: dict[str, int] = {}  # str(note_path) -> depth
+        self.collected_attachments: set[str] = set()
+        # Both caches are filled by _build_caches on the first lookup;
+        # None marks the attachment index as not yet built
         self._note_cache: dict[str, Path] = {}  # filename -> full path
+        self._attachment_cache: dict[str, Path] | None = None  # lowercase filename -> full path
+        # Memoized lookup results, keyed on the raw link target
+        self._note_lookup_cache: dict[str, Path | None] = {}
+        self._attachment_lookup_cache: dict[str, Path | None] = {}
+        # Note text read during collection, reused by the export phase
+        self._content_cache: dict[str, str] = {}
+
+    def _scandir_files(self, path: Path) -> Iterator[os.DirEntry]:
+        """
+        Recursively yield DirEntry objects for regular files under a directory.
 
-    def _build_note_cache(self) -> None:
-        """Build a cache of all markdown files in the vault for fast lookup."""
-        for md_file in self.vault_path.rglob('*.md'):
-            # Store by filename (without extension) for wiki-link lookup
-            name = md_file.stem
-            if name not in self._note_cache:
-                self._note_cache[name] = md_file
+        Uses os.scandir() instead of pathlib.rglob() so that is_file()/is_dir()
+        checks reuse the metadata cached on each DirEntry, avoiding extra
+        stat() syscalls per entry.
+
+        Args:
+            path: Directory to scan
+
+        Yields:
+            DirEntry objects for regular files
+        """
+        try:
+            entries = os.scandir(path)
+        except PermissionError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune non-content subtrees (.git, .obsidian, etc.)
+                    if entry.name.startswith('.') or entry.name in self.skip_dirs:
+                        continue
+                    yield from self._scandir_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+    def _build_caches(self) -> None:
+        """Build note and attachment caches in a single vault scan.
+
+        Both indexes are built eagerly on the first lookup of either kind
+        (in practice export() triggers this while resolving the MOC file);
+        one pass fills both, since classifying attachments while already
+        reading directory entries costs almost nothing extra.
+        """
+        self._attachment_cache = {}
+        for entry in self._scandir_files(self.vault_path):
+            name = entry.name
+            if name.endswith('.md'):
+                # Store by filename (without extension) for wiki-link lookup.
+                # On stem collisions the shallowest path wins, so a bare
+                # [[Name]] resolves to vault/Name.md when it exists -- the
+                # same file the old direct-path probe returned -- instead of
+                # whichever duplicate the directory scan happened to reach
+                # first
+                stem = name[:-3]
+                md_path = Path(entry.path)
+                existing = self._note_cache.get(stem)
+                if existing is None or len(md_path.parts) < len(existing.parts):
+                    self._note_cache[stem] = md_path
+            elif self.is_attachment(name):
+                self._attachment_cache.setdefault(name.lower(), Path(entry.path))
 
     def find_note_file(self, link_target: str) -> Path | None:
         """
@@ -54,24 +167,38 @@ class ObsidianMOCExporter:
         Returns:
             Path to the note file if found, None otherwise
         """
-        # Build cache on first call
+        if link_target in self._note_lookup_cache:
+            return self._note_lookup_cache[link_target]
+
+        result = self._find_note_file(link_target)
+        self._note_lookup_cache[link_target] = result
+        return result
+
+    def _find_note_file(self, link_target: str) -> Path | None:
+        """Uncached lookup behind find_note_file."""
+        # Build caches on first call
         if not self._note_cache:
-            self._build_note_cache()
+            self._build_caches()
 
         # Remove any heading or block reference
-        link_target = link_target.split('#')[0].strip()
+        link_target = link_target.partition('#')[0].strip()
         if not link_target:
             return None
 
-        # Try as direct path first
+        # Bare names resolve via the in-memory cache without touching the
+        # filesystem; only path-style targets need the direct probe
+        name = Path(link_target).stem
+        if '/' not in link_target and name in self._note_cache:
+            return self._note_cache[name]
+
+        # Try as direct path
         direct_path = self.vault_path / link_target
         if not direct_path.suffix:
             direct_path = direct_path.with_suffix('.md')
         if direct_path.exists():
             return direct_path
 
-        # Try finding by filename in cache
-        name = Path(link_target).stem
+        # Last resort: match path-style targets by filename
         if name in self._note_cache:
             return self._note_cache[name]
 
@@ -87,19 +214,25 @@ class ObsidianMOCExporter:
         Returns:
             Path to the attachment file if found, None otherwise
         """
+        if link_target in self._attachment_lookup_cache:
+            return self._attachment_lookup_cache[link_target]
+
+        result = self._find_attachment_file(link_target)
+        self._attachment_lookup_cache[link_target] = result
+        return result
+
+    def _find_attachment_file(self, link_target: str) -> Path | None:
+        """Uncached lookup behind find_attachment_file."""
         # Try as direct path first
         direct_path = self.vault_path / link_target
         if direct_path.exists():
             return direct_path
 
-        # Search in common attachment directories
-        for search_dir in ['attachments', 'assets', 'images', 'files', '']:
-            search_path = self.vault_path / search_dir if search_dir else self.vault_path
-            if search_path.exists():
-                for attachment in search_path.rglob(Path(link_target).name):
-                    return attachment
-
-        return None
+        # Fall back to the attachment index (built alongside the note cache
+        # in a single vault scan on first use)
+        if self._attachment_cache is None:
+            self._build_caches()
+        return self._attachment_cache.get(Path(link_target).name.lower())
 
     def is_attachment(self, filename: str) -> bool:
         """
@@ -111,8 +244,7 @@ class ObsidianMOCExporter:
         Returns:
             True if the file is an attachment, False otherwise
         """
-        ext = Path(filename).suffix.lower()
-        return ext in self.ATTACHMENT_EXTENSIONS
+        return _ATTACHMENT_RE.search(filename) is not None
 
     def is_image(self, filename: str) -> bool:
         """
@@ -124,8 +256,7 @@ class ObsidianMOCExporter:
         Returns:
             True if the file is an image, False otherwise
         """
-        ext = Path(filename).suffix.lower()
-        return ext in self.IMAGE_EXTENSIONS
+        return _ext(filename) in _IMAGE_EXTENSIONS
 
     def extract_links(self, content: str) -> List[Tuple[str, str | None, bool]]:
         """
@@ -139,20 +270,43 @@ class ObsidianMOCExporter:
         """
         links = []
 
-        # Extract embeds first
-        for match in self.EMBED_PATTERN.finditer(content):
-            target = match.group(1)
-            alias = match.group(2)
-            links.append((target, alias, True))
-
-        # Extract regular wiki-links
-        for match in self.WIKILINK_PATTERN.finditer(content):
-            target = match.group(1)
-            alias = match.group(2)
-            links.append((target, alias, False))
+        for match in self.LINK_PATTERN.finditer(content):
+            target = match.group(2) + (match.group(3) or '')
+            alias = match.group(4)
+            links.append((target, alias, match.group(1) == '!'))
 
         return links
 
+    @staticmethod
+    def _strip_comments(content: str) -> str:
+        """
+        Remove %%...%% Obsidian comments from content.
+
+        A str.find scanner stays O(n) on any input; the old '%%.*?%%' DOTALL
+        regex re-scanned to end of string for every unbalanced '%%'. An
+        unmatched opening '%%' is kept verbatim, as the regex did.
+
+        Args:
+            content: The markdown content
+
+        Returns:
+            Content with comments removed
+        """
+        out = []
+        i = 0
+        while True:
+            start = content.find('%%', i)
+            if start < 0:
+                out.append(content[i:])
+                break
+            out.append(content[i:start])
+            end = content.find('%%', start + 2)
+            if end < 0:
+                out.append(content[start:])
+                break
+            i = end + 2
+        return ''.join(out)
+
     def convert_to_standard_markdown(self, content: str) -> str:
         """
         Convert Obsidian-flavored markdown to standard markdown.
@@ -164,121 +318,141 @@ class ObsidianMOCExporter:
             Standard markdown content
         """
         # Remove comments
-        content = self.COMMENT_PATTERN.sub('', content)
-
-        # Convert embeds to links/images
-        def replace_embed(match: re.Match) -> str:
-            target = match.group(1)
-            alias = match.group(2)
-
-            # Remove heading/block references for filename
-            filename = target.split('#')[0]
-
-            # Parse alias to extract alt text (exclude width specifications like "300" or "300x200")
-            parsed_alt = None
-            if alias:
-                parts = alias.split('|')
-                for part in parts:
-                    part = part.strip()
-                    # Skip if it's a width specification (e.g., "300", "300x200")
-                    if not re.match(r'^\d+(x\d+)?$', part):
-                        parsed_alt = part
-                        break
-
-            if self.is_attachment(filename):
-                # Find and collect the attachment
-                attachment_path = self.find_attachment_file(filename)
-                if attachment_path:
-                    self.collected_attachments.add(attachment_path)
-
-                # Use just the filename for flat output structure
-                output_filename = Path(filename).name
-
-                if self.is_image(filename):
-                    # Image: ![alt](image.png)
-                    alt_text = parsed_alt if parsed_alt else Path(filename).stem
-                    return f'![{alt_text}]({output_filename})'
+        content = self._strip_comments(content)
+
+        # Convert embeds and wiki-links in a single pass
+        def replace_link(match: re.Match) -> str:
+            is_embed = match.group(1) == '!'
+            filename = match.group(2)
+            target = filename + (match.group(3) or '')
+            alias = match.group(4)
+
+            # Neither a filename nor a heading (e.g. '[[]]'): not a link
+            if not target:
+                return match.group(0)
+
+            if is_embed:
+                # Parse alias to extract alt text (exclude width specifications like "300" or "300x200")
+                parsed_alt = None
+                if alias:
+                    parts = alias.split('|')
+                    for part in parts:
+                        part = part.strip()
+                        # Skip if it's a width specification (e.g., "300", "300x200")
+                        if not _DIMENSION_RE.match(part):
+                            parsed_alt = part
+                            break
+
+                if self.is_attachment(filename):
+                    # Find and collect the attachment
+                    attachment_path = self.find_attachment_file(filename)
+                    if attachment_path:
+                        self.collected_attachments.add(str(attachment_path))
+
+                    # Use just the filename for flat output structure
+                    output_filename = Path(filename).name
+
+                    if self.is_image(filename):
+                        # Image: ![alt](image.png)
+                        alt_text = parsed_alt if parsed_alt else Path(filename).stem
+                        return f'![{alt_text}]({output_filename})'
+                    else:
+                        # Other attachment: [name](file.pdf)
+                        link_text = parsed_alt if parsed_alt else Path(filename).name
+                        return f'[{link_text}]({output_filename})'
                 else:
-                    # Other attachment: [name](file.pdf)
-                    link_text = parsed_alt if parsed_alt else Path(filename).name
-                    return f'[{link_text}]({output_filename})'
+                    # Note embed -> regular link
+                    link_text = parsed_alt if parsed_alt else target
+                    note_filename = Path(filename).stem + '.md'
+                    return f'[{link_text}]({note_filename})'
             else:
-                # Note embed -> regular link
-                link_text = parsed_alt if parsed_alt else target
-                note_filename = Path(filename).stem + '.md'
-                return f'[{link_text}]({note_filename})'
-
-        content = self.EMBED_PATTERN.sub(replace_embed, content)
-
-        # Convert wiki-links
-        def replace_wikilink(match: re.Match) -> str:
-            target = match.group(1)
-            alias = match.group(2)
-
-            # Handle heading/block references
-            filename = target.split('#')[0]
-            link_text = alias if alias else target
-
-            if self.is_attachment(filename):
-                # Attachment link
-                attachment_path = self.find_attachment_file(filename)
-                if attachment_path:
-                    self.collected_attachments.add(attachment_path)
-                output_filename = Path(filename).name
-                return f'[{link_text}]({output_filename})'
-            else:
-                # Note link
-                note_filename = (Path(filename).stem + '.md') if filename else target
-                return f'[{link_text}]({note_filename})'
+                link_text = alias if alias else target
+
+                if self.is_attachment(filename):
+                    # Attachment link
+                    attachment_path = self.find_attachment_file(filename)
+                    if attachment_path:
+                        self.collected_attachments.add(str(attachment_path))
+                    output_filename = Path(filename).name
+                    return f'[{link_text}]({output_filename})'
+                else:
+                    # Note link; same-page heading links keep their target
+                    note_filename = (Path(filename).stem + '.md') if filename else target
+                    return f'[{link_text}]({note_filename})'
 
-        content = self.WIKILINK_PATTERN.sub(replace_wikilink, content)
+        content = self.LINK_PATTERN.sub(replace_link, content)
 
         return content
 
-    def collect_notes_recursive(self, note_path: Path, current_depth: int = 0) -> None:
+    def collect_notes(self, moc_file: Path) -> None:
         """
-        Recursively collect notes starting from a given note.
+        Collect notes reachable from the MOC file via breadth-first traversal.
+
+        BFS visits each note at its minimum depth first, so deep MOC graphs
+        neither blow the Python stack nor need depth re-comparison on revisit.
 
         Args:
-            note_path: Path to the starting note
-            current_depth: Current traversal depth
+            moc_file: Path to the starting note
         """
-        # Skip if already collected at same or lower depth
-        if note_path in self.collected_notes:
-            if self.collected_notes[note_path] <= current_depth:
-                return
+        queue: deque[tuple[Path, int]] = deque([(moc_file, 0)])
+        while queue:
+            note_path, depth = queue.popleft()
+            key = str(note_path)
+            if key in self.collected_notes:
+                continue
+            self.collected_notes[key] = depth
 
-        self.collected_notes[note_path] = current_depth
+            # Stop traversal if max depth reached
+            if depth >= self.max_depth:
+                continue
 
-        # Stop recursion if max depth reached
-        if current_depth >= self.max_depth:
-            return
+            # Read and parse the note
+            try:
+                content = note_path.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"Warning: Could not read {note_path}: {e}")
+                continue
+            self._content_cache[key] = content
+
+            # Extract links and process them
+            for target, _, is_embed in self.extract_links(content):
+                # Remove heading/block references
+                filename = target.partition('#')[0].strip()
+                if not filename:
+                    continue
+
+                if self.is_attachment(filename):
+                    # Collect attachment
+                    attachment_path = self.find_attachment_file(filename)
+                    if attachment_path:
+                        self.collected_attachments.add(str(attachment_path))
+                else:
+                    # Enqueue linked note
+                    linked_note = self.find_note_file(filename)
+                    if linked_note:
+                        queue.append((linked_note, depth + 1))
 
-        # Read and parse the note
-        try:
-            content = note_path.read_text(encoding='utf-8')
-        except Exception as e:
-            print(f"Warning: Could not read {note_path}: {e}")
-            return
+    def _resolve_output_name(self, filename: str, used: set[str]) -> str:
+        """
+        Pick an output filename that does not collide with already-used names.
 
-        # Extract links and process them
-        links = self.extract_links(content)
-        for target, _, is_embed in links:
-            # Remove heading/block references
-            filename = target.split('#')[0].strip()
-            if not filename:
-                continue
+        Args:
+            filename: Desired output filename
+            used: Set of filenames already assigned in the output directory;
+                the chosen name is added to it
 
-            if self.is_attachment(filename):
-                # Collect attachment
-                attachment_path = self.find_attachment_file(filename)
-                if attachment_path:
-                    self.collected_attachments.add(attachment_path)
-            else:
-                # Recursively collect linked note
-                linked_note = self.find_note_file(filename)
-                if linked_note:
-                    self.collect_notes_recursive(linked_note, current_depth + 1)
+        Returns:
+            The chosen filename, suffixed with _N on collision
+        """
+        if filename in used:
+            stem = Path(filename).stem
+            suffix = Path(filename).suffix
+            counter = 1
+            while f"{stem}_{counter}{suffix}" in used:
+                counter += 1
+            filename = f"{stem}_{counter}{suffix}"
+        used.add(filename)
+        return filename
 
     def export(self, moc_path: str) -> dict:
         """
@@ -290,6 +464,14 @@ class ObsidianMOCExporter:
         Returns:
             Dictionary with export statistics
         """
+        # Drop all cached state so a repeat export on the same instance sees
+        # current vault contents instead of stale paths or note text
+        self._note_cache.clear()
+        self._attachment_cache = None
+        self._note_lookup_cache.clear()
+        self._attachment_lookup_cache.clear()
+        self._content_cache.clear()
+
         # Find the MOC file
         moc_file = self.find_note_file(moc_path)
         if not moc_file:
@@ -301,8 +483,8 @@ class ObsidianMOCExporter:
         print(f"Starting export from: {moc_file}")
         print(f"Max depth: {self.max_depth}")
 
-        # Collect all notes recursively
-        self.collect_notes_recursive(moc_file, current_depth=0)
+        # Collect all reachable notes
+        self.collect_notes(moc_file)
 
         print(f"Collected {len(self.collected_notes)} notes")
         print(f"Collected {len(self.collected_attachments)} attachments")
@@ -310,49 +492,74 @@ class ObsidianMOCExporter:
         # Create output directory
         self.output_path.mkdir(parents=True, exist_ok=True)
 
-        # Export notes
-        exported_notes = 0
-        for note_path in self.collected_notes:
-            try:
+        # Track assigned output names in memory so collision handling needs
+        # no per-candidate exists() probes; seed with pre-existing files
+        used_names: set[str] = set(os.listdir(self.output_path))
+
+        # Resolve output names single-threaded (flat structure, collision
+        # handling must stay sequential), then run the per-file work in a
+        # thread pool: read_text/write_text/copy release the GIL, so threads
+        # overlap I/O with the regex conversion work
+        note_jobs = []
+        for key in self.collected_notes:
+            note_path = Path(key)
+            note_jobs.append(
+                (note_path, self.output_path / self._resolve_output_name(note_path.name, used_names))
+            )
+
+        def export_note(note_path: Path, output_file: Path) -> None:
+            # Reuse the text read during collection to avoid a second pass
+            # over the vault; notes at max depth were never read there
+            content = self._content_cache.get(str(note_path))
+            if content is None:
                 content = note_path.read_text(encoding='utf-8')
-                converted = self.convert_to_standard_markdown(content)
-
-                # Write to output (flat structure)
-                output_file = self.output_path / note_path.name
-
-                # Handle filename collisions
-                if output_file.exists():
-                    stem = output_file.stem
-                    suffix = output_file.suffix
-                    counter = 1
-                    while output_file.exists():
-                        output_file = self.output_path / f"{stem}_{counter}{suffix}"
-                        counter += 1
-
-                output_file.write_text(converted, encoding='utf-8')
-                exported_notes += 1
-            except Exception as e:
-                print(f"Warning: Could not export {note_path}: {e}")
+            converted = self.convert_to_standard_markdown(content)
+            # A single write either way (write_text also issues one, and
+            # data larger than the buffer bypasses it); the explicit buffer
+            # only pays off if this ever streams converted chunks instead
+            with output_file.open('w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(converted)
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        # Export notes; attachments referenced by embeds are collected as a
+        # side effect of conversion, so this wave must finish first
+        exported_notes = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(export_note, note_path, output_file): note_path
+                for note_path, output_file in note_jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    exported_notes += 1
+                except Exception as e:
+                    print(f"Warning: Could not export {futures[future]}: {e}")
 
         # Copy attachments
+        attachment_jobs = []
+        for key in self.collected_attachments:
+            attachment_path = Path(key)
+            attachment_jobs.append(
+                (attachment_path, self.output_path / self._resolve_output_name(attachment_path.name, used_names))
+            )
+
+        # copyfile uses the platform zero-copy path (sendfile/copy_file_range)
+        # where available; metadata is not needed for NotebookLM import, so
+        # copy2's extra copystat is skipped
         exported_attachments = 0
-        for attachment_path in self.collected_attachments:
-            try:
-                output_file = self.output_path / attachment_path.name
-
-                # Handle filename collisions
-                if output_file.exists():
-                    stem = output_file.stem
-                    suffix = output_file.suffix
-                    counter = 1
-                    while output_file.exists():
-                        output_file = self.output_path / f"{stem}_{counter}{suffix}"
-                        counter += 1
-
-                shutil.copy2(attachment_path, output_file)
-                exported_attachments += 1
-            except Exception as e:
-                print(f"Warning: Could not copy {attachment_path}: {e}")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(shutil.copyfile, attachment_path, output_file): attachment_path
+                for attachment_path, output_file in attachment_jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    exported_attachments += 1
+                except Exception as e:
+                    print(f"Warning: Could not copy {futures[future]}: {e}")
 
         stats = {
             'notes_collected': len(self.collected_notes),
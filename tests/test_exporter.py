@@ -80,6 +80,18 @@ class TestConvertToStandardMarkdown:
         result = exporter.convert_to_standard_markdown(content)
         assert result == "[Note Name#Heading](Note Name.md)"
 
+    def test_wikilink_same_page_heading(self, exporter):
+        """Test same-page heading link without a filename."""
+        content = "[[#Heading]]"
+        result = exporter.convert_to_standard_markdown(content)
+        assert result == "[#Heading](#Heading)"
+
+    def test_wikilink_same_page_heading_with_alias(self, exporter):
+        """Test same-page heading link with alias."""
+        content = "[[#Heading|alias]]"
+        result = exporter.convert_to_standard_markdown(content)
+        assert result == "[alias](#Heading)"
+
     # Comment tests
     def test_comment_removal(self, exporter):
         """Test that Obsidian comments are removed."""
@@ -124,6 +136,22 @@ Another [[Page|alias]] here.
         assert "%%This is a comment%%" not in result
 
 
+class TestFindNoteFile:
+    """Tests for find_note_file method."""
+
+    def test_duplicate_stem_prefers_vault_root(self, tmp_path):
+        """A bare link resolves to the vault-root note when stems collide."""
+        vault_path = tmp_path / "vault"
+        sub_path = vault_path / "sub"
+        sub_path.mkdir(parents=True)
+        (sub_path / "Dup.md").write_text("nested", encoding="utf-8")
+        (vault_path / "Dup.md").write_text("root", encoding="utf-8")
+        exporter = ObsidianMOCExporter(vault_path, tmp_path / "output")
+
+        assert exporter.find_note_file("Dup") == vault_path / "Dup.md"
+        assert exporter.find_note_file("sub/Dup") == sub_path / "Dup.md"
+
+
 class TestIsAttachment:
     """Tests for is_attachment method."""
 
@@ -151,5 +179,44 @@ class TestIsAttachment:
         assert not exporter.is_attachment("README.md")
 
 
+class TestResolveOutputName:
+    """Tests for _resolve_output_name method."""
+
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        vault_path = tmp_path / "vault"
+        vault_path.mkdir()
+        output_path = tmp_path / "output"
+        return ObsidianMOCExporter(vault_path, output_path)
+
+    def test_unique_name_kept(self, exporter):
+        """A name with no collision is returned as-is and marked used."""
+        used = set()
+        assert exporter._resolve_output_name("Note.md", used) == "Note.md"
+        assert used == {"Note.md"}
+
+    def test_collision_appends_counter(self, exporter):
+        """Colliding names get _1, _2, ... suffixes."""
+        used = {"Note.md"}
+        assert exporter._resolve_output_name("Note.md", used) == "Note_1.md"
+        assert exporter._resolve_output_name("Note.md", used) == "Note_2.md"
+        assert used == {"Note.md", "Note_1.md", "Note_2.md"}
+
+    def test_export_seeds_used_from_existing_output_dir(self, tmp_path):
+        """Export does not overwrite files already in the output directory."""
+        vault_path = tmp_path / "vault"
+        vault_path.mkdir()
+        (vault_path / "MOC.md").write_text("hello", encoding="utf-8")
+        output_path = tmp_path / "output"
+        output_path.mkdir()
+        (output_path / "MOC.md").write_text("pre-existing", encoding="utf-8")
+
+        exporter = ObsidianMOCExporter(vault_path, output_path)
+        exporter.export("MOC.md")
+
+        assert (output_path / "MOC.md").read_text(encoding="utf-8") == "pre-existing"
+        assert (output_path / "MOC_1.md").read_text(encoding="utf-8") == "hello"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])